@@ -5,10 +5,10 @@ Command Line Interface for eBay Autolister
 
 import click
 import os
+import asyncio
 import json
 import logging
 from typing import Optional
-from ebay_autolister import EbayAutolister, ConditionMapper
 from config import Config, create_sample_env
 
 @click.group()
@@ -41,6 +41,8 @@ def cli(ctx, verbose):
 @click.pass_context
 def setup(ctx):
     """Initialize eBay Autolister configuration"""
+    from ebay_autolister import EbayAutolister
+    
     click.echo("🚀 Setting up eBay Autolister...")
     
     # Create sample .env file
@@ -61,26 +63,69 @@ def setup(ctx):
     click.echo("📄 Sample CSV created: sample_products.csv")
 
 @cli.command()
-@click.argument('csv_file', type=click.Path(exists=True))
+@click.argument('csv_file')
 @click.option('--create-listings', is_flag=True, help='Create listings after inventory items')
 @click.option('--dry-run', is_flag=True, help='Preview actions without making API calls')
+@click.option('--count', is_flag=True, help='With --dry-run, also count every data row in the file')
+@click.option('--workers', type=click.IntRange(min=1), help='Convert rows in this many processes (for CPU-heavy files)')
 @click.pass_context
-def process(ctx, csv_file, create_listings, dry_run):
-    """Process CSV file and create inventory items"""
+def process(ctx, csv_file, create_listings, dry_run, count, workers):
+    """Process CSV file (local path or http(s) URL, optionally gzipped) and create inventory items"""
+    from ebay_autolister import EbayAutolister, is_remote_path
+    
     config = ctx.obj['config']
     
+    if count and not dry_run:
+        raise click.UsageError("--count requires --dry-run")
+    
+    if not is_remote_path(csv_file) and not os.path.exists(csv_file):
+        raise click.BadParameter(f"File '{csv_file}' does not exist.", param_hint="'CSV_FILE'")
+    
     if dry_run:
         click.echo(f"🔍 Dry run mode - would process: {csv_file}")
         # Load and validate CSV
         from ebay_autolister import CSVProcessor
-        items = CSVProcessor.load_items_from_csv(csv_file)
         
-        click.echo(f"📊 Found {len(items)} items to process:")
+        async def load_preview():
+            # Read one item past the 5 shown, just to know whether more exist
+            preview = []
+            items = CSVProcessor.iter_items_from_csv_async(csv_file)
+            try:
+                async for item in items:
+                    preview.append(item)
+                    if len(preview) == 6:
+                        break
+            finally:
+                await items.aclose()
+            return preview
+        
+        try:
+            items = asyncio.run(load_preview())
+        except Exception as e:
+            click.echo(f"❌ Could not read {csv_file}: {e}")
+            ctx.exit(1)
+        
+        total = None
+        if count:
+            try:
+                total = asyncio.run(CSVProcessor.count_rows_async(csv_file))
+            except Exception as e:
+                click.echo(f"❌ Could not count rows in {csv_file}: {e}")
+                ctx.exit(1)
+        
+        # Rows are counted without converting them, so some may still fail to load
+        if total is not None:
+            click.echo(f"📊 Found {total} rows to process:")
+        else:
+            click.echo("📊 Items to process:")
         for item in items[:5]:  # Show first 5
             click.echo(f"  • {item.sku}: {item.title} - ${item.price}")
         
         if len(items) > 5:
-            click.echo(f"  ... and {len(items) - 5} more items")
+            if total is not None:
+                click.echo(f"  ... and {total - 5} more rows")
+            else:
+                click.echo("  ... and more items (use --count for the total)")
         
         click.echo(f"🔄 Would create inventory items: {'Yes' if items else 'No'}")
         click.echo(f"📋 Would create listings: {'Yes' if create_listings else 'No'}")
@@ -97,7 +142,7 @@ def process(ctx, csv_file, create_listings, dry_run):
     
     # Process the file
     with click.progressbar(length=100, label='Processing') as bar:
-        results = autolister.process_csv_file(csv_file, create_listings)
+        results = autolister.process_csv_file(csv_file, create_listings, workers)
         bar.update(100)
     
     # Display results
@@ -114,12 +159,19 @@ def process(ctx, csv_file, create_listings, dry_run):
         click.echo("\n❌ Failed Items:")
         for failed in results['failed_items'][:5]:  # Show first 5 failures
             click.echo(f"  • {failed['sku']}: {failed['error']}")
+    
+    # Reading stops at an unreadable row; items before it were still processed
+    if results.get('csv_error'):
+        click.echo(f"\n❌ Stopped reading CSV: {results['csv_error']}")
+        ctx.exit(1)
 
 @cli.command()
 @click.argument('sku')
 @click.pass_context
 def check(ctx, sku):
     """Check status of inventory item by SKU"""
+    from ebay_autolister import EbayAutolister
+    
     config = ctx.obj['config']
     
     autolister = EbayAutolister(
@@ -165,6 +217,8 @@ def config_info(ctx):
 @click.pass_context
 def create_sample(ctx, output_file):
     """Create a sample CSV file with example products"""
+    from ebay_autolister import EbayAutolister
+    
     config = ctx.obj['config']
     
     autolister = EbayAutolister(
@@ -181,6 +235,8 @@ def create_sample(ctx, output_file):
 @click.pass_context
 def test_connection(ctx, marketplace):
     """Test connection to eBay API"""
+    from ebay_autolister import EbayAutolister
+    
     config = ctx.obj['config']
     
     click.echo("🔗 Testing eBay API connection...")
@@ -208,6 +264,8 @@ def test_connection(ctx, marketplace):
 @click.option('--grade', default='', help='Optional grade (PSA 1-10, A+/A/B/C, etc.)')
 def map_condition(condition, grade):
     """Test condition mapping to eBay standards"""
+    from ebay_autolister import ConditionMapper
+    
     click.echo(f"🔍 Mapping condition: '{condition}' with grade: '{grade}'")
     
     ebay_condition = ConditionMapper.map_condition(condition, grade)
@@ -270,6 +328,7 @@ def test(full):
         click.echo("🔍 Running basic configuration tests...")
         
         from config import Config
+        from ebay_autolister import ConditionMapper
         config = Config()
         
         # Test configuration
@@ -6,17 +6,82 @@ Integrates with eBay Inventory API for bulk listing creation and management
 
 import json
 import csv
+import re
+import base64
+import asyncio
+import codecs
+import zlib
+import orjson
 import requests
+import aiohttp
+import aiofiles
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+import random
 import os
+import hashlib
+import tempfile
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union, Any, AsyncIterable, AsyncIterator, Awaitable, Callable
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-import pandas as pd
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from config import CONDITION_MAPPINGS, GRADE_MAPPINGS
 
-@dataclass
+# Constant units of the inventory payload
+DIMENSION_UNIT = "INCH"
+WEIGHT_UNIT = "POUND"
+
+# Human-readable descriptions for eBay condition enums
+CONDITION_DESCRIPTIONS = {
+    'NEW': 'Brand new, unopened item in original packaging',
+    'LIKE_NEW': 'Opened but in like-new condition',
+    'NEW_OTHER': 'New item, may be missing original packaging',
+    'NEW_WITH_DEFECTS': 'New item with minor defects',
+    'CERTIFIED_REFURBISHED': 'Certified refurbished by manufacturer',
+    'SELLER_REFURBISHED': 'Refurbished by seller to working condition',
+    'USED_EXCELLENT': 'Used item in excellent condition',
+    'USED_VERY_GOOD': 'Used item in very good condition',
+    'USED_GOOD': 'Used item in good condition',
+    'USED_ACCEPTABLE': 'Used item in acceptable condition',
+    'FOR_PARTS_OR_NOT_WORKING': 'Item for parts or not working'
+}
+
+# Column order CSV rows are normalized to before building InventoryItems
+CSV_COLUMNS = ('sku', 'title', 'description', 'condition', 'category_id', 'price', 'quantity',
+               'brand', 'mpn', 'upc', 'grade', 'weight', 'dimensions', 'images')
+REQUIRED_CSV_COLUMNS = ('sku', 'title', 'description', 'category_id', 'price')
+
+# CSV files larger than this are parsed with pyarrow when it is installed
+LARGE_CSV_BYTES = 10 * 1024 * 1024
+
+# Bytes pyarrow parses per record batch
+ARROW_BLOCK_BYTES = 8 << 20
+
+# Rows sent to a worker process at a time when converting in parallel
+ROW_CHUNK_SIZE = 500
+
+# Read size for streaming CSVs from disk or over HTTP
+CSV_CHUNK_BYTES = 1 << 20
+
+# A line and its terminator, split the way open(newline='') does
+CSV_LINE_PATTERN = re.compile(r'[^\r\n]*(?:\r\n|\r|\n)')
+
+# Chunks or row batches buffered between a CSV reader thread and the event loop
+CSV_QUEUE_SIZE = 8
+
+# Longest Retry-After wait honoured for a single throttled request
+MAX_RETRY_AFTER = 60.0
+
+# OAuth tokens are cached here so short CLI runs can skip re-authenticating
+TOKEN_CACHE_DIR = os.path.expanduser("~/.cache/ebay_autolister")
+
+@dataclass(slots=True)
 class InventoryItem:
     sku: str
     title: str
@@ -54,14 +119,16 @@ class ConditionMapper:
         Returns:
             Valid eBay condition enum value
         """
+        grade_clean = str(grade).strip().upper() if grade else ""
+        return ConditionMapper._map_normalized(condition.lower().strip(), grade_clean)
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _map_normalized(condition_clean: str, grade_clean: str) -> str:
+        """Resolve a normalized condition/grade pair, memoized per distinct pair"""
         # First try to map by grade if provided
-        if grade:
-            grade_clean = str(grade).strip().upper()
-            if grade_clean in GRADE_MAPPINGS:
-                return GRADE_MAPPINGS[grade_clean]
-        
-        # Map by condition
-        condition_clean = condition.lower().strip()
+        if grade_clean in GRADE_MAPPINGS:
+            return GRADE_MAPPINGS[grade_clean]
         
         # Direct mapping
         if condition_clean in CONDITION_MAPPINGS:
@@ -87,42 +154,89 @@ class ConditionMapper:
             return 'FOR_PARTS_OR_NOT_WORKING'
         
         # Ultimate fallback
-        logging.warning(f"Could not map condition '{condition}' with grade '{grade}', defaulting to USED_GOOD")
+        logging.warning(f"Could not map condition '{condition_clean}' with grade '{grade_clean}', defaulting to USED_GOOD")
         return 'USED_GOOD'
     
     @staticmethod
     def get_condition_description(condition: str, grade: str = "") -> str:
         """Get a human-readable description for the condition"""
         ebay_condition = ConditionMapper.map_condition(condition, grade)
-        
-        descriptions = {
-            'NEW': 'Brand new, unopened item in original packaging',
-            'LIKE_NEW': 'Opened but in like-new condition',
-            'NEW_OTHER': 'New item, may be missing original packaging',
-            'NEW_WITH_DEFECTS': 'New item with minor defects',
-            'CERTIFIED_REFURBISHED': 'Certified refurbished by manufacturer',
-            'SELLER_REFURBISHED': 'Refurbished by seller to working condition',
-            'USED_EXCELLENT': 'Used item in excellent condition',
-            'USED_VERY_GOOD': 'Used item in very good condition',
-            'USED_GOOD': 'Used item in good condition',
-            'USED_ACCEPTABLE': 'Used item in acceptable condition',
-            'FOR_PARTS_OR_NOT_WORKING': 'Item for parts or not working'
-        }
-        
-        base_description = descriptions.get(ebay_condition, 'Used item')
+        return ConditionMapper.describe_condition(ebay_condition, grade)
+    
+    @staticmethod
+    def describe_condition(ebay_condition: str, grade: str = "") -> str:
+        """Get a human-readable description for an already-mapped eBay condition"""
+        base_description = CONDITION_DESCRIPTIONS.get(ebay_condition, 'Used item')
         
         if grade:
             return f"{base_description} (Grade: {grade})"
         
         return base_description
 
+def is_remote_path(path: str) -> bool:
+    """Whether a CSV path is an http(s) URL rather than a local file"""
+    return path.startswith(('http://', 'https://'))
+
+async def abatched(items: Union[Iterable, AsyncIterable], size: int) -> AsyncIterator[List]:
+    """Yield lists of up to size items from a sync or async iterable"""
+    if hasattr(items, '__aiter__'):
+        batch = []
+        async for item in items:
+            batch.append(item)
+            if len(batch) == size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    else:
+        items = iter(items)
+        while True:
+            batch = list(islice(items, size))
+            if not batch:
+                return
+            yield batch
+
+class TokenBucket:
+    """Token-bucket rate limiter shared by the sync and async API clients"""
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # A negative balance queues callers behind earlier reservations
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+    
+    def acquire(self):
+        """Block until a request may be sent"""
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+    
+    async def acquire_async(self):
+        """Wait until a request may be sent without blocking the event loop"""
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
 class EbayAPI:
     """eBay API client with OAuth authentication and rate limiting"""
     
-    def __init__(self, client_id: str, client_secret: str, sandbox: bool = True):
+    def __init__(self, client_id: str, client_secret: str, sandbox: bool = True,
+                 requests_per_second: float = 10.0, burst: int = 10):
         self.client_id = client_id
         self.client_secret = client_secret
         self.sandbox = sandbox
+        self._auth_header = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
         self.access_token = None
         self.token_expires = 0
         
@@ -131,23 +245,50 @@ class EbayAPI:
         self.inventory_url = f"{base_url}/sell/inventory/v1"
         self.oauth_url = "https://api.sandbox.ebay.com/identity/v1/oauth2/token" if sandbox else "https://api.ebay.com/identity/v1/oauth2/token"
         
+        # Token cache file is keyed per app and environment
+        cache_key = hashlib.sha256(f"{client_id}:{sandbox}".encode()).hexdigest()[:16]
+        self.token_cache_path = os.path.join(TOKEN_CACHE_DIR, f"token_{cache_key}.json")
+        
+        # Persistent session keeps TCP/TLS connections warm between calls
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            # Only connection failures are retried here: they never reached eBay, so they
+            # cost no rate-limit budget. Status retries go through _make_request instead
+            max_retries=Retry(
+                total=3,
+                connect=3,
+                read=0,
+                backoff_factor=0.5,
+                respect_retry_after_header=False
+            )
+        )
+        self.session.mount("https://api.ebay.com", adapter)
+        self.session.mount("https://api.sandbox.ebay.com", adapter)
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept': 'application/json'
+        })
+        
         # Rate limiting
-        self.last_request = 0
-        self.min_interval = 0.1  # 100ms between requests
+        self.rate_limiter = TokenBucket(requests_per_second, burst)
+        self.max_attempts = 3  # Attempts per request on 429 (or 5xx for idempotent methods)
         
-        # Setup logging
-        logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
         
     def authenticate(self) -> bool:
         """Get OAuth access token for API requests"""
+        if self.access_token is None:
+            self._load_cached_token()
+        
         if self.access_token and time.time() < self.token_expires:
             return True
             
         try:
             headers = {
                 'Content-Type': 'application/x-www-form-urlencoded',
-                'Authorization': f'Basic {self._get_auth_header()}'
+                'Authorization': f'Basic {self._auth_header}'
             }
             
             data = {
@@ -155,12 +296,15 @@ class EbayAPI:
                 'scope': 'https://api.ebay.com/oauth/api_scope/sell.inventory'
             }
             
-            response = requests.post(self.oauth_url, headers=headers, data=data)
+            response = self.session.post(self.oauth_url, headers=headers, data=data)
             response.raise_for_status()
             
             token_data = response.json()
-            self.access_token = token_data['access_token']
-            self.token_expires = time.time() + token_data['expires_in'] - 300  # 5min buffer
+            self._set_access_token(
+                token_data['access_token'],
+                time.time() + token_data['expires_in'] - 300  # 5min buffer
+            )
+            self._save_cached_token()
             
             self.logger.info("Successfully authenticated with eBay API")
             return True
@@ -169,107 +313,343 @@ class EbayAPI:
             self.logger.error(f"Authentication failed: {e}")
             return False
     
-    def _get_auth_header(self) -> str:
-        """Generate base64 encoded auth header"""
-        import base64
-        auth_string = f"{self.client_id}:{self.client_secret}"
-        return base64.b64encode(auth_string.encode()).decode()
+    def _set_access_token(self, access_token: str, token_expires: float):
+        """Store the access token and attach it to the session"""
+        self.access_token = access_token
+        self.token_expires = token_expires
+        self.session.headers['Authorization'] = f'Bearer {access_token}'
     
-    def _rate_limit(self):
-        """Enforce rate limiting between API calls"""
-        elapsed = time.time() - self.last_request
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        self.last_request = time.time()
+    def _load_cached_token(self):
+        """Load a still-valid access token from the on-disk cache"""
+        try:
+            with open(self.token_cache_path) as f:
+                token_data = json.load(f)
+            
+            if time.time() < token_data['token_expires']:
+                self._set_access_token(token_data['access_token'], token_data['token_expires'])
+                self.logger.debug("Loaded cached eBay access token")
+                
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    
+    def _save_cached_token(self):
+        """Persist the access token so later runs can reuse it"""
+        try:
+            os.makedirs(os.path.dirname(self.token_cache_path), mode=0o700, exist_ok=True)
+            
+            # Write a private (0600) temp file unique to this process, then swap it in,
+            # so readers and concurrent runs never see a partial or mixed file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.token_cache_path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump({
+                        'access_token': self.access_token,
+                        'token_expires': self.token_expires
+                    }, f)
+                os.replace(tmp_path, self.token_cache_path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+            
+        except OSError as e:
+            self.logger.warning(f"Could not cache access token: {e}")
+    
+    @staticmethod
+    def _retry_after(headers) -> float:
+        """Seconds to wait before retrying a throttled request"""
+        try:
+            return min(float(headers.get('Retry-After', 1)), MAX_RETRY_AFTER)
+        except ValueError:
+            return 1.0
+    
+    @staticmethod
+    def _request_kwargs(method: str, data: Dict = None) -> Tuple[str, Dict]:
+        """Normalize the HTTP method and build the params/body arguments for it"""
+        method = method.upper()
+        if method == 'GET':
+            return method, {'params': data}
+        if method in ('POST', 'PUT'):
+            # Session headers already declare the JSON content type
+            return method, {'data': orjson.dumps(data)} if data is not None else {}
+        if method == 'DELETE':
+            return method, {}
+        raise ValueError(f"Unsupported HTTP method: {method}")
+    
+    def _retry_delay(self, method: str, status: int, headers, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying a response, or None to return it as-is"""
+        if attempt == self.max_attempts:
+            return None
+        
+        if status == 429:
+            retry_after = self._retry_after(headers)
+            self.logger.warning(f"Rate limited by eBay API, retrying in {retry_after}s")
+            return retry_after
+        
+        # Server errors are only retried where repeating the request is safe
+        if status >= 500 and method in ('GET', 'PUT', 'DELETE'):
+            delay = 0.5 * 2 ** (attempt - 1)
+            self.logger.warning(f"eBay API returned {status}, retrying in {delay}s")
+            return delay
+        
+        return None
+    
+    def _log_request_error(self, error: Exception, body: str, level: int = logging.ERROR):
+        """Log a failed API request along with eBay's response body"""
+        self.logger.log(level, f"API request failed: {error}")
+        self.logger.log(level, f"Response: {body}")
+    
+    def _invalidate_token(self):
+        """Forget an access token eBay rejected, including its cached copy"""
+        self.access_token = None
+        self.token_expires = 0
+        self.session.headers.pop('Authorization', None)
+        
+        try:
+            os.remove(self.token_cache_path)
+        except OSError:
+            pass
+    
+    def _reauthenticate(self):
+        """Replace a rejected access token with a freshly issued one"""
+        self.logger.warning("eBay rejected the access token, re-authenticating")
+        self._invalidate_token()
+        if not self.authenticate():
+            raise Exception("Failed to authenticate")
     
     def _make_request(self, method: str, endpoint: str, data: Dict = None) -> Dict:
         """Make authenticated API request with rate limiting"""
         if not self.authenticate():
             raise Exception("Failed to authenticate")
         
-        self._rate_limit()
+        url = f"{self.inventory_url}/{endpoint}"
+        method, kwargs = self._request_kwargs(method, data)
+        
+        response = self._send(method, url, kwargs)
+        if response.status_code == 401:
+            # The token may have been revoked or the credentials rotated since it was cached
+            self._reauthenticate()
+            response = self._send(method, url, kwargs)
+        
+        try:
+            response.raise_for_status()
+            return orjson.loads(response.content) if response.content else {}
+        except requests.exceptions.HTTPError as e:
+            self._log_request_error(e, response.text)
+            raise
+    
+    def _send(self, method: str, url: str, kwargs: Dict) -> requests.Response:
+        """Send a request, retrying the responses _retry_delay allows"""
+        # Every attempt waits on the rate limiter, retries included
+        for attempt in range(1, self.max_attempts + 1):
+            self.rate_limiter.acquire()
+            response = self.session.request(method, url, **kwargs)
+            
+            retry_after = self._retry_delay(method, response.status_code, response.headers, attempt)
+            if retry_after is None:
+                return response
+            time.sleep(retry_after)
+
+class AsyncEbayAPI:
+    """Asynchronous eBay API client for running many requests concurrently"""
+    
+    def __init__(self, api: EbayAPI, concurrency: int = 10):
+        # Credentials, endpoints and the OAuth token are shared with the sync client
+        self.api = api
+        self.concurrency = concurrency
+        self.session = None
+        self.semaphore = None
+        self._auth_lock = None
+        self._depth = 0
+        self.logger = logging.getLogger(__name__)
+    
+    async def __aenter__(self):
+        # Nested use shares the outermost session
+        if self._depth == 0:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.concurrency)
+            )
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+            self._auth_lock = asyncio.Lock()
+        self._depth += 1
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self._depth -= 1
+        if self._depth == 0:
+            await self.session.close()
+            self.session = None
+    
+    async def authenticate(self) -> bool:
+        """Get OAuth access token without blocking the event loop"""
+        if self.api.access_token and time.time() < self.api.token_expires:
+            return True
+        
+        # Only one concurrent caller refreshes the token
+        async with self._auth_lock:
+            return await asyncio.to_thread(self.api.authenticate)
+    
+    async def _reauthenticate(self, rejected_token: str):
+        """Replace a rejected access token, once for all concurrent callers"""
+        async with self._auth_lock:
+            # Requests that failed with the same token wait here for the first refresh
+            if self.api.access_token == rejected_token:
+                await asyncio.to_thread(self.api._reauthenticate)
+    
+    async def _make_request(self, method: str, endpoint: str, data: Dict = None,
+                            caller_retries_5xx: bool = False) -> Dict:
+        """
+        Make authenticated API request with rate limiting
+        
+        Args:
+            method: HTTP method
+            endpoint: Path below the Inventory API base URL
+            data: JSON body, or query parameters for GET
+            caller_retries_5xx: Log 5xx responses as warnings, since the caller will retry them
+        """
+        if not await self.authenticate():
+            raise Exception("Failed to authenticate")
+        
+        url = f"{self.api.inventory_url}/{endpoint}"
+        method, kwargs = EbayAPI._request_kwargs(method, data)
+        
+        token = self.api.access_token
+        response, body = await self._send(method, url, token, kwargs)
+        if response.status == 401:
+            # The token may have been revoked or the credentials rotated since it was cached
+            await self._reauthenticate(token)
+            response, body = await self._send(method, url, self.api.access_token, kwargs)
         
+        try:
+            response.raise_for_status()
+            return orjson.loads(body) if body else {}
+        except aiohttp.ClientResponseError as e:
+            log_level = logging.WARNING if caller_retries_5xx and e.status >= 500 else logging.ERROR
+            self.api._log_request_error(e, body.decode(errors='replace'), log_level)
+            raise
+    
+    async def _send(self, method: str, url: str, token: str, kwargs: Dict) -> Tuple[aiohttp.ClientResponse, bytes]:
+        """Send a request, retrying the responses _retry_delay allows"""
         headers = {
-            'Authorization': f'Bearer {self.access_token}',
+            'Authorization': f'Bearer {token}',
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         }
         
-        url = f"{self.inventory_url}/{endpoint}"
+        for attempt in range(1, self.api.max_attempts + 1):
+            async with self.semaphore:
+                await self.api.rate_limiter.acquire_async()
+                async with self.session.request(method, url, headers=headers, **kwargs) as response:
+                    body = await response.read()
+            
+            retry_after = self.api._retry_delay(method, response.status, response.headers, attempt)
+            if retry_after is None:
+                return response, body
+            
+            # Back off outside the semaphore so other requests keep flowing
+            await asyncio.sleep(retry_after)
+    
+    async def run_batch(self, items: Union[Iterable, AsyncIterable], operation: Callable[[Any], Awaitable],
+                        batch_size: int = 20) -> List:
+        """Run an async operation over items, keeping up to batch_size calls in flight"""
+        tasks = []
+        running = set()
         
-        if method.upper() == 'GET':
-            response = requests.get(url, headers=headers, params=data)
-        elif method.upper() == 'POST':
-            response = requests.post(url, headers=headers, json=data)
-        elif method.upper() == 'PUT':
-            response = requests.put(url, headers=headers, json=data)
-        elif method.upper() == 'DELETE':
-            response = requests.delete(url, headers=headers)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
+        async def submit(item):
+            # Start the next call as soon as any earlier one finishes, rather than
+            # waiting for a whole batch, so items keep being read in the meantime
+            if len(running) >= batch_size:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()  # Surface failures as soon as they happen
+            
+            task = asyncio.ensure_future(operation(item))
+            running.add(task)
+            task.add_done_callback(running.discard)
+            tasks.append(task)
         
         try:
-            response.raise_for_status()
-            return response.json() if response.text else {}
-        except requests.exceptions.HTTPError as e:
-            self.logger.error(f"API request failed: {e}")
-            self.logger.error(f"Response: {response.text}")
-            raise
+            if hasattr(items, '__aiter__'):
+                async for item in items:
+                    await submit(item)
+            else:
+                for item in items:
+                    await submit(item)
+            
+            await asyncio.gather(*running)
+            return [task.result() for task in tasks]
+        finally:
+            for task in list(running):
+                task.cancel()
 
 class InventoryManager:
     """Manages eBay inventory items and bulk operations"""
     
-    def __init__(self, api: EbayAPI):
+    def __init__(self, api: EbayAPI, async_api: AsyncEbayAPI = None):
         self.api = api
+        self.async_api = async_api or AsyncEbayAPI(api)
+        self.max_batch_attempts = 3  # Attempts per bulk batch on 5xx/connection errors
         self.logger = logging.getLogger(__name__)
     
-    def create_inventory_item(self, item: InventoryItem) -> bool:
-        """Create a single inventory item"""
-        try:
-            # Map condition using the condition mapper
-            ebay_condition = ConditionMapper.map_condition(item.condition, item.grade)
-            
-            inventory_data = {
-                "availability": {
-                    "shipToLocationAvailability": {
-                        "quantity": item.quantity
-                    }
-                },
-                "condition": ebay_condition,
-                "conditionDescription": ConditionMapper.get_condition_description(item.condition, item.grade),
-                "product": {
-                    "title": item.title,
-                    "description": item.description,
-                    "aspects": {},
-                    "brand": item.brand,
-                    "mpn": item.mpn if item.mpn else item.sku,
-                    "imageUrls": item.images[:12]  # Max 12 images
+    @staticmethod
+    def _build_inventory_payload(item: InventoryItem, include_sku: bool = False) -> Dict:
+        """Build the inventory item request body shared by single and bulk calls"""
+        # Map condition using the condition mapper
+        ebay_condition = ConditionMapper.map_condition(item.condition, item.grade)
+        dimensions = item.dimensions
+        
+        product = {
+            "title": item.title,
+            "description": item.description,
+            "aspects": {},
+            "brand": item.brand,
+            "mpn": item.mpn if item.mpn else item.sku,
+            "imageUrls": item.images[:12]  # Max 12 images
+        }
+        
+        # Add UPC if provided
+        if item.upc:
+            product["upc"] = [item.upc]
+        
+        # Add brand to aspects if provided
+        if item.brand:
+            product["aspects"]["Brand"] = [item.brand]
+        
+        # Add grade to aspects if provided
+        if item.grade:
+            product["aspects"]["Grade"] = [item.grade]
+        
+        inventory_data = {
+            "availability": {
+                "shipToLocationAvailability": {
+                    "quantity": item.quantity
+                }
+            },
+            "condition": ebay_condition,
+            "conditionDescription": ConditionMapper.describe_condition(ebay_condition, item.grade),
+            "product": product,
+            "packageWeightAndSize": {
+                "dimensions": {
+                    "height": dimensions["height"],
+                    "length": dimensions["length"],
+                    "width": dimensions["width"],
+                    "unit": DIMENSION_UNIT
                 },
-                "packageWeightAndSize": {
-                    "dimensions": {
-                        "height": item.dimensions["height"],
-                        "length": item.dimensions["length"],
-                        "width": item.dimensions["width"],
-                        "unit": "INCH"
-                    },
-                    "weight": {
-                        "value": item.weight,
-                        "unit": "POUND"
-                    }
+                "weight": {
+                    "value": item.weight,
+                    "unit": WEIGHT_UNIT
                 }
             }
-            
-            # Add UPC if provided
-            if item.upc:
-                inventory_data["product"]["upc"] = [item.upc]
-            
-            # Add brand to aspects if provided
-            if item.brand:
-                inventory_data["product"]["aspects"]["Brand"] = [item.brand]
-            
-            # Add grade to aspects if provided
-            if item.grade:
-                inventory_data["product"]["aspects"]["Grade"] = [item.grade]
+        }
+        
+        if include_sku:
+            inventory_data["sku"] = item.sku
+        
+        return inventory_data
+    
+    def create_inventory_item(self, item: InventoryItem) -> bool:
+        """Create a single inventory item"""
+        try:
+            inventory_data = self._build_inventory_payload(item)
             
             response = self.api._make_request('PUT', f"inventory_item/{item.sku}", inventory_data)
             self.logger.info(f"Created inventory item: {item.sku}")
@@ -279,66 +659,30 @@ class InventoryManager:
             self.logger.error(f"Failed to create inventory item {item.sku}: {e}")
             return False
     
-    def bulk_create_inventory_items(self, items: List[InventoryItem], batch_size: int = 25) -> Dict:
+    def bulk_create_inventory_items(self, items: Iterable[InventoryItem], batch_size: int = 25) -> Dict:
         """Create multiple inventory items in batches"""
+        return asyncio.run(self.bulk_create_inventory_items_async(items, batch_size))
+    
+    async def bulk_create_inventory_items_async(self, items: Union[Iterable[InventoryItem], AsyncIterable[InventoryItem]],
+                                                batch_size: int = 25) -> Dict:
+        """Create multiple inventory items in batches, submitting batches concurrently"""
         results = {"successful": [], "failed": []}
         
-        # Process in batches of 25 (API limit)
-        for i in range(0, len(items), batch_size):
-            batch = items[i:i + batch_size]
-            batch_data = {"requests": []}
-            
-            for item in batch:
-                # Map condition using the condition mapper
-                ebay_condition = ConditionMapper.map_condition(item.condition, item.grade)
-                
-                inventory_data = {
-                    "sku": item.sku,
-                    "product": {
-                        "title": item.title,
-                        "description": item.description,
-                        "brand": item.brand,
-                        "mpn": item.mpn if item.mpn else item.sku,
-                        "imageUrls": item.images[:12],
-                        "aspects": {}
-                    },
-                    "condition": ebay_condition,
-                    "conditionDescription": ConditionMapper.get_condition_description(item.condition, item.grade),
-                    "availability": {
-                        "shipToLocationAvailability": {
-                            "quantity": item.quantity
-                        }
-                    },
-                    "packageWeightAndSize": {
-                        "dimensions": {
-                            "height": item.dimensions["height"],
-                            "length": item.dimensions["length"],
-                            "width": item.dimensions["width"],
-                            "unit": "INCH"
-                        },
-                        "weight": {
-                            "value": item.weight,
-                            "unit": "POUND"
-                        }
-                    }
-                }
-                
-                # Add UPC if provided
-                if item.upc:
-                    inventory_data["product"]["upc"] = [item.upc]
-                
-                # Add brand to aspects if provided
-                if item.brand:
-                    inventory_data["product"]["aspects"]["Brand"] = [item.brand]
-                
-                # Add grade to aspects if provided
-                if item.grade:
-                    inventory_data["product"]["aspects"]["Grade"] = [item.grade]
-                
-                batch_data["requests"].append(inventory_data)
+        async def numbered_batches():
+            # Process in batches of 25 (API limit)
+            batch_number = 0
+            async for batch in abatched(items, batch_size):
+                batch_number += 1
+                yield batch_number, batch
+        
+        async def submit_batch(numbered_batch):
+            batch_number, batch = numbered_batch
+            batch_data = {
+                "requests": [self._build_inventory_payload(item, include_sku=True) for item in batch]
+            }
             
             try:
-                response = self.api._make_request('POST', 'bulk_create_or_replace_inventory_item', batch_data)
+                response = await self._post_batch_with_retry(batch_data, batch_number)
                 
                 # Process response
                 for idx, resp in enumerate(response.get('responses', [])):
@@ -351,15 +695,39 @@ class InventoryManager:
                             "error": resp.get('errors', ['Unknown error'])
                         })
                 
-                self.logger.info(f"Processed batch {i//batch_size + 1}: {len(batch)} items")
+                self.logger.info(f"Processed batch {batch_number}: {len(batch)} items")
                 
             except Exception as e:
                 self.logger.error(f"Batch creation failed: {e}")
                 for item in batch:
                     results["failed"].append({"sku": item.sku, "error": str(e)})
         
+        async with self.async_api:
+            await self.async_api.run_batch(
+                numbered_batches(), submit_batch,
+                batch_size=self.async_api.concurrency
+            )
+        
         return results
     
+    async def _post_batch_with_retry(self, batch_data: Dict, batch_number: int) -> Dict:
+        """POST a bulk batch, retrying 5xx and connection failures with jittered exponential backoff"""
+        # 429s are already retried by the client, so they are not retried again here
+        for attempt in range(1, self.max_batch_attempts + 1):
+            try:
+                # 5xx failures that will be retried are only warnings; the final one is an error
+                return await self.async_api._make_request('POST', 'bulk_create_or_replace_inventory_item', batch_data,
+                                                          caller_retries_5xx=attempt < self.max_batch_attempts)
+            except (aiohttp.ClientResponseError, aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                status = getattr(e, 'status', None)
+                retryable = status is None or status >= 500
+                if not retryable or attempt == self.max_batch_attempts:
+                    raise
+                
+                delay = min(2 ** attempt + random.random(), 30)
+                self.logger.warning(f"Batch {batch_number} attempt {attempt} failed ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+    
     def get_inventory_item(self, sku: str) -> Dict:
         """Retrieve inventory item by SKU"""
         try:
@@ -371,32 +739,39 @@ class InventoryManager:
 class ListingManager:
     """Manages eBay listing offers and publication"""
     
-    def __init__(self, api: EbayAPI):
+    def __init__(self, api: EbayAPI, async_api: AsyncEbayAPI = None):
         self.api = api
+        self.async_api = async_api or AsyncEbayAPI(api)
         self.logger = logging.getLogger(__name__)
     
+    @staticmethod
+    def _build_offer_data(sku: str, category_id: str, price: float,
+                          marketplace_id: str = "EBAY_US") -> Dict:
+        """Build the offer request body for an inventory item"""
+        return {
+            "sku": sku,
+            "marketplaceId": marketplace_id,
+            "format": "FIXED_PRICE",
+            "availableQuantity": 1,  # Will be pulled from inventory
+            "categoryId": category_id,
+            "pricingSummary": {
+                "price": {
+                    "value": str(price),
+                    "currency": "USD"
+                }
+            },
+            "listingPolicies": {
+                "fulfillmentPolicyId": "DEFAULT",  # Replace with actual policy
+                "paymentPolicyId": "DEFAULT",      # Replace with actual policy
+                "returnPolicyId": "DEFAULT"        # Replace with actual policy
+            }
+        }
+    
     def create_offer(self, sku: str, category_id: str, price: float, 
                     marketplace_id: str = "EBAY_US") -> str:
         """Create an offer for an inventory item"""
         try:
-            offer_data = {
-                "sku": sku,
-                "marketplaceId": marketplace_id,
-                "format": "FIXED_PRICE",
-                "availableQuantity": 1,  # Will be pulled from inventory
-                "categoryId": category_id,
-                "pricingSummary": {
-                    "price": {
-                        "value": str(price),
-                        "currency": "USD"
-                    }
-                },
-                "listingPolicies": {
-                    "fulfillmentPolicyId": "DEFAULT",  # Replace with actual policy
-                    "paymentPolicyId": "DEFAULT",      # Replace with actual policy
-                    "returnPolicyId": "DEFAULT"        # Replace with actual policy
-                }
-            }
+            offer_data = self._build_offer_data(sku, category_id, price, marketplace_id)
             
             response = self.api._make_request('POST', 'offer', offer_data)
             offer_id = response.get('offerId')
@@ -407,6 +782,21 @@ class ListingManager:
             self.logger.error(f"Failed to create offer for {sku}: {e}")
             return None
     
+    async def create_offer_async(self, sku: str, category_id: str, price: float,
+                                 marketplace_id: str = "EBAY_US") -> str:
+        """Create an offer for an inventory item without blocking the event loop"""
+        try:
+            offer_data = self._build_offer_data(sku, category_id, price, marketplace_id)
+            
+            response = await self.async_api._make_request('POST', 'offer', offer_data)
+            offer_id = response.get('offerId')
+            self.logger.info(f"Created offer {offer_id} for SKU {sku}")
+            return offer_id
+            
+        except Exception as e:
+            self.logger.error(f"Failed to create offer for {sku}: {e}")
+            return None
+    
     def publish_offer(self, offer_id: str) -> bool:
         """Publish an offer to create active listing"""
         try:
@@ -416,51 +806,410 @@ class ListingManager:
         except Exception as e:
             self.logger.error(f"Failed to publish offer {offer_id}: {e}")
             return False
+    
+    async def publish_offer_async(self, offer_id: str) -> bool:
+        """Publish an offer without blocking the event loop"""
+        try:
+            await self.async_api._make_request('POST', f'offer/{offer_id}/publish')
+            self.logger.info(f"Published offer {offer_id}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to publish offer {offer_id}: {e}")
+            return False
+
+# Module-level so ProcessPoolExecutor workers can unpickle it
+def _row_to_item(row: Tuple[Any, ...]) -> InventoryItem:
+    """Build an InventoryItem from a CSV row, naming the SKU if a value is invalid"""
+    try:
+        return _parse_row(row)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid CSV row for SKU {row[0]!r}: {e}") from None
+
+def _rows_to_items_chunk(rows: List[Tuple[Any, ...]]) -> Tuple[List[InventoryItem], Optional[Exception]]:
+    """Convert rows in a worker process, returning the items before the first invalid row and its error"""
+    items = []
+    try:
+        for row in rows:
+            items.append(_row_to_item(row))
+    except ValueError as e:
+        return items, e
+    return items, None
+
+def _parse_row(row: Tuple[Any, ...]) -> InventoryItem:
+    """Build an InventoryItem from a CSV row in CSV_COLUMNS order"""
+    # Rows from the pyarrow reader arrive with numbers already typed (blank cells as None),
+    # so the float()/int() calls below only parse text from the stdlib reader
+    (sku, title, description, condition, category_id, price, quantity,
+     brand, mpn, upc, grade, weight, dimensions, images) = row
+    
+    # Parse dimensions if provided
+    dimensions_parsed = {"length": 10.0, "width": 10.0, "height": 10.0}
+    if dimensions:
+        dim_parts = dimensions.split('x')
+        if len(dim_parts) == 3:
+            dimensions_parsed = {
+                "length": float(dim_parts[0]),
+                "width": float(dim_parts[1]),
+                "height": float(dim_parts[2])
+            }
+    
+    # Parse image URLs
+    image_urls = []
+    if images:
+        image_urls = [url.strip() for url in images.split(',')]
+    
+    return InventoryItem(
+        sku=sku,
+        title=title,
+        description=description,
+        condition=condition or 'NEW',
+        category_id=category_id,
+        price=float(price),
+        quantity=int(quantity or 1),
+        brand=brand,
+        mpn=mpn,
+        upc=upc,
+        grade=grade,
+        weight=float(weight or 1.0),
+        dimensions=dimensions_parsed,
+        images=image_urls
+    )
 
 class CSVProcessor:
     """Processes CSV files for bulk inventory management"""
     
     @staticmethod
-    def load_items_from_csv(file_path: str) -> List[InventoryItem]:
-        """Load inventory items from CSV file"""
-        items = []
+    def iter_items_from_csv(file_path: str, workers: Optional[int] = None) -> Iterator[InventoryItem]:
+        """
+        Stream inventory items from CSV file one row at a time
         
-        try:
-            df = pd.read_csv(file_path)
-            
-            for _, row in df.iterrows():
-                # Parse dimensions if provided
-                dimensions = {"length": 10.0, "width": 10.0, "height": 10.0}
-                if 'dimensions' in row and pd.notna(row['dimensions']):
-                    dim_parts = str(row['dimensions']).split('x')
-                    if len(dim_parts) == 3:
-                        dimensions = {
-                            "length": float(dim_parts[0]),
-                            "width": float(dim_parts[1]),
-                            "height": float(dim_parts[2])
-                        }
+        Args:
+            file_path: Path to the CSV file
+            workers: Optional number of processes to convert rows in; only pays
+                off when per-row validation is CPU-heavy
+        """
+        yield from CSVProcessor._rows_to_items(CSVProcessor._iter_rows(file_path), workers)
+    
+    @staticmethod
+    def _rows_to_items(rows: Iterable[Tuple[str, ...]], workers: Optional[int] = None) -> Iterator[InventoryItem]:
+        """Convert rows to items, optionally spread across worker processes"""
+        if not workers or workers < 2:
+            yield from map(_row_to_item, rows)
+            return
+        
+        rows = iter(rows)
+        window = ROW_CHUNK_SIZE * workers
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Submit the next window before yielding the current one so workers stay busy,
+            # while memory stays bounded to two windows of rows
+            pending = None
+            while True:
+                window_rows = list(islice(rows, window))
+                chunks = [window_rows[i:i + ROW_CHUNK_SIZE] for i in range(0, len(window_rows), ROW_CHUNK_SIZE)]
+                results = executor.map(_rows_to_items_chunk, chunks) if chunks else None
+                if pending is not None:
+                    for items, error in pending:
+                        yield from items
+                        if error:
+                            raise error
+                if results is None:
+                    return
+                pending = results
+    
+    @staticmethod
+    def _iter_rows(file_path: str) -> Iterator[Tuple[Any, ...]]:
+        """Yield CSV rows as tuples in CSV_COLUMNS order, using pyarrow for large files"""
+        if os.path.getsize(file_path) > LARGE_CSV_BYTES:
+            try:
+                import pyarrow as pa
+                from pyarrow import csv as pa_csv
+            except ImportError:
+                pass  # pyarrow is optional; fall back to the stdlib reader
+            else:
+                with open(file_path, newline='', encoding='utf-8-sig') as f:
+                    header = next(csv.reader(f))
+                indices = CSVProcessor._column_indices(header)
                 
-                # Parse image URLs
-                images = []
-                if 'images' in row and pd.notna(row['images']):
-                    images = [url.strip() for url in str(row['images']).split(',')]
+                # Cast numeric columns once while parsing; everything else stays text,
+                # like the stdlib reader, so SKUs/UPCs keep leading zeros
+                numeric_types = {'price': pa.float64(), 'quantity': pa.int64(), 'weight': pa.float64()}
+                rows_read = 0
+                try:
+                    reader = pa_csv.open_csv(
+                        file_path,
+                        read_options=pa_csv.ReadOptions(block_size=ARROW_BLOCK_BYTES, use_threads=True),
+                        # Quoted descriptions may span lines, and so block boundaries
+                        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                        convert_options=pa_csv.ConvertOptions(
+                            column_types={name: numeric_types.get(name, pa.string()) for name in header}
+                        )
+                    )
+                    for batch in reader:
+                        # Convert whole columns at once rather than building a dict per row
+                        columns = [column.to_pylist() for column in batch.columns]
+                        columns.append([''] * batch.num_rows)  # Stands in for absent columns
+                        yield from zip(*(columns[i] for i in indices))
+                        rows_read += batch.num_rows
+                    return
+                    
+                except pa.ArrowInvalid as e:
+                    # e.g. a short row, which the stdlib reader pads; it picks up
+                    # from the first row pyarrow did not yield
+                    logging.warning(f"pyarrow could not parse {file_path} ({e}), continuing with the csv module")
+                    with open(file_path, newline='', encoding='utf-8-sig') as f:
+                        yield from islice(CSVProcessor._select_rows(csv.reader(f)), rows_read, None)
+                    return
+        
+        with open(file_path, newline='', encoding='utf-8-sig') as f:
+            yield from CSVProcessor._select_rows(csv.reader(f))
+    
+    @staticmethod
+    def _select_rows(reader: Iterator[List[str]]) -> Iterator[Tuple[str, ...]]:
+        """Yield the data rows of a csv.reader in CSV_COLUMNS order, skipping blank lines"""
+        header = next(reader, None)
+        if header is None:
+            return
+        
+        select_row = CSVProcessor._row_selector(header)
+        for row in reader:
+            if row:
+                yield select_row(row)
+    
+    @staticmethod
+    async def iter_items_from_csv_async(path_or_url: str, workers: Optional[int] = None) -> AsyncIterator[InventoryItem]:
+        """
+        Stream inventory items from a local path or http(s) URL, gzipped or not
+        
+        Args:
+            path_or_url: Local path or http(s) URL of the CSV file
+            workers: Optional number of processes to convert rows in, as for iter_items_from_csv
+        """
+        # Rows are parsed and converted in a background thread, so reading overlaps
+        # with whatever the event loop is doing with earlier items
+        if not is_remote_path(path_or_url) and not path_or_url.endswith('.gz'):
+            # Plain local files keep the pyarrow fast path
+            items = CSVProcessor._iter_in_thread(
+                lambda: CSVProcessor._rows_to_items(CSVProcessor._iter_rows(path_or_url), workers)
+            )
+        else:
+            items = CSVProcessor._iter_rows_async(
+                path_or_url, lambda rows: CSVProcessor._rows_to_items(rows, workers)
+            )
+        
+        try:
+            async for item in items:
+                yield item
+        finally:
+            await items.aclose()
+    
+    @staticmethod
+    async def count_rows_async(path_or_url: str) -> int:
+        """Count data rows in a CSV without building InventoryItems"""
+        if not is_remote_path(path_or_url) and not path_or_url.endswith('.gz'):
+            def count_local() -> int:
+                with open(path_or_url, newline='', encoding='utf-8-sig') as f:
+                    return max(sum(1 for row in csv.reader(f) if row) - 1, 0)
+            
+            return await asyncio.to_thread(count_local)
+        
+        count = 0
+        rows = CSVProcessor._iter_rows_async(path_or_url)
+        try:
+            async for _ in rows:
+                count += 1
+        finally:
+            await rows.aclose()
+        return count
+    
+    @staticmethod
+    async def _iter_rows_async(path_or_url: str, convert: Callable[[Iterator[Tuple[str, ...]]], Iterable] = None) -> AsyncIterator:
+        """
+        Yield CSV rows in CSV_COLUMNS order while the source is still downloading
+        
+        Args:
+            path_or_url: Local path or http(s) URL, optionally gzipped
+            convert: Optional function applied to the row iterator in the parser thread
+        """
+        loop = asyncio.get_running_loop()
+        texts = asyncio.Queue(maxsize=CSV_QUEUE_SIZE)
+        
+        async def download():
+            decoder = codecs.getincrementaldecoder('utf-8-sig')()
+            try:
+                async for chunk in CSVProcessor._iter_bytes_async(path_or_url):
+                    await texts.put(decoder.decode(chunk))
+                await texts.put(decoder.decode(b'', final=True))
+            except Exception as e:
+                await texts.put(e)  # Re-raised by the parser thread
+            else:
+                await texts.put(None)
+        
+        def lines() -> Iterator[str]:
+            # Runs in the parser thread, waiting on the event loop for more text
+            pending = ''
+            while (text := asyncio.run_coroutine_threadsafe(texts.get(), loop).result()) is not None:
+                if isinstance(text, Exception):
+                    raise text
                 
-                item = InventoryItem(
-                    sku=str(row['sku']),
-                    title=str(row['title']),
-                    description=str(row['description']),
-                    condition=str(row.get('condition', 'NEW')),
-                    category_id=str(row['category_id']),
-                    price=float(row['price']),
-                    quantity=int(row.get('quantity', 1)),
-                    brand=str(row.get('brand', '')),
-                    mpn=str(row.get('mpn', '')),
-                    upc=str(row.get('upc', '')),
-                    grade=str(row.get('grade', '')),
-                    weight=float(row.get('weight', 1.0)),
-                    dimensions=dimensions,
-                    images=images
-                )
+                # Split on \r, \n and \r\n like open(newline=''), holding back a trailing
+                # \r that may be the first half of a \r\n split across chunks
+                text = pending + text
+                end = 0
+                for match in CSV_LINE_PATTERN.finditer(text, 0, len(text) - text.endswith('\r')):
+                    yield match.group()
+                    end = match.end()
+                pending = text[end:]
+            
+            # Last line may not end with a newline
+            if pending:
+                yield pending
+        
+        def parse() -> Iterable:
+            rows = CSVProcessor._select_rows(csv.reader(lines()))
+            return convert(rows) if convert else rows
+        
+        # A single reader sees every line, so quoting state carries across chunks
+        downloader = asyncio.create_task(download())
+        rows = CSVProcessor._iter_in_thread(parse)
+        try:
+            async for row in rows:
+                yield row
+        finally:
+            await rows.aclose()
+            downloader.cancel()
+            
+            # Wake the parser thread if it is still waiting for text
+            while not texts.empty():
+                texts.get_nowait()
+            texts.put_nowait(None)
+    
+    @staticmethod
+    async def _iter_in_thread(make_iterable: Callable[[], Iterable]) -> AsyncIterator:
+        """Run a blocking iterator in a background thread and yield its values on the event loop"""
+        loop = asyncio.get_running_loop()
+        batches = asyncio.Queue(maxsize=CSV_QUEUE_SIZE)
+        closed = threading.Event()
+        
+        def put(batch):
+            # Blocks this thread, not the event loop, until the consumer catches up
+            if not closed.is_set():
+                asyncio.run_coroutine_threadsafe(batches.put(batch), loop).result()
+        
+        def produce():
+            batch = []
+            try:
+                for value in make_iterable():
+                    batch.append(value)
+                    if len(batch) == ROW_CHUNK_SIZE:
+                        put(batch)
+                        batch = []
+                        if closed.is_set():
+                            return
+                if batch:
+                    put(batch)
+                put([])  # An empty batch marks the end
+            except Exception as e:
+                # Hand over everything read before the error, then the error itself
+                if batch:
+                    put(batch)
+                put(e)
+        
+        threading.Thread(target=produce, daemon=True).start()
+        try:
+            while batch := await batches.get():
+                if isinstance(batch, Exception):
+                    raise batch
+                for value in batch:
+                    yield value
+        finally:
+            closed.set()
+            
+            # Free the slot a blocked put is waiting for, so the thread can exit
+            while not batches.empty():
+                batches.get_nowait()
+    
+    @staticmethod
+    async def _iter_bytes_async(path_or_url: str) -> AsyncIterator[bytes]:
+        """Read a local file or http(s) URL in chunks, transparently gunzipping"""
+        if is_remote_path(path_or_url):
+            async def read_chunks():
+                async with aiohttp.ClientSession() as session:
+                    async with session.get(path_or_url) as response:
+                        response.raise_for_status()
+                        async for chunk in response.content.iter_chunked(CSV_CHUNK_BYTES):
+                            yield chunk
+        else:
+            async def read_chunks():
+                async with aiofiles.open(path_or_url, 'rb') as f:
+                    while True:
+                        chunk = await f.read(CSV_CHUNK_BYTES)
+                        if not chunk:
+                            return
+                        yield chunk
+        
+        decompressor = None
+        head = b''
+        async for chunk in read_chunks():
+            # Detect gzip from its magic bytes rather than trusting the file name
+            if decompressor is None:
+                head += chunk
+                if len(head) < 2:
+                    continue
+                chunk, head = head, b''
+                if chunk.startswith(b'\x1f\x8b'):
+                    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+                else:
+                    decompressor = False
+            
+            if not decompressor:
+                yield chunk
+                continue
+            
+            while chunk:
+                yield decompressor.decompress(chunk)
+                if decompressor.eof:
+                    # Concatenated gzip members each need a fresh decompressor
+                    chunk = decompressor.unused_data
+                    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+                else:
+                    chunk = b''
+        
+        # Sources shorter than the magic number are passed through as-is
+        if head:
+            yield head
+    
+    @staticmethod
+    def _row_selector(header: List[str]) -> Callable[[List[str]], Tuple[str, ...]]:
+        """Build a function that reorders raw rows into CSV_COLUMNS order"""
+        width = len(header)
+        select = itemgetter(*CSVProcessor._column_indices(header))
+        
+        def select_row(row: List[str]) -> Tuple[str, ...]:
+            if len(row) != width:
+                row = (row + [''] * width)[:width]
+            row.append('')  # Stands in for absent columns
+            return select(row)
+        
+        return select_row
+    
+    @staticmethod
+    def _column_indices(header: List[str]) -> List[int]:
+        """Map CSV_COLUMNS to header positions; absent optional columns map past the end"""
+        missing = [name for name in REQUIRED_CSV_COLUMNS if name not in header]
+        if missing:
+            raise KeyError(f"Missing required columns: {', '.join(missing)}")
+        
+        positions = {name: i for i, name in enumerate(header)}
+        return [positions.get(name, len(header)) for name in CSV_COLUMNS]
+    
+    @staticmethod
+    def load_items_from_csv(file_path: str, workers: Optional[int] = None) -> List[InventoryItem]:
+        """Load inventory items from CSV file, stopping at the first unreadable row"""
+        items = []
+        
+        try:
+            for item in CSVProcessor.iter_items_from_csv(file_path, workers):
                 items.append(item)
                 
         except Exception as e:
@@ -473,51 +1222,75 @@ class EbayAutolister:
     
     def __init__(self, client_id: str, client_secret: str, sandbox: bool = True):
         self.api = EbayAPI(client_id, client_secret, sandbox)
-        self.inventory = InventoryManager(self.api)
-        self.listings = ListingManager(self.api)
+        self.async_api = AsyncEbayAPI(self.api)
+        self.inventory = InventoryManager(self.api, self.async_api)
+        self.listings = ListingManager(self.api, self.async_api)
         self.logger = logging.getLogger(__name__)
         
-    def process_csv_file(self, csv_path: str, create_listings: bool = False) -> Dict:
+    def process_csv_file(self, csv_path: str, create_listings: bool = False,
+                         workers: Optional[int] = None) -> Dict:
         """Process CSV file and create inventory items and optionally listings"""
-        items = CSVProcessor.load_items_from_csv(csv_path)
-        
-        if not items:
-            self.logger.error("No items found in CSV file")
-            return {"success": False, "message": "No items found"}
-        
-        # Create inventory items
-        self.logger.info(f"Creating {len(items)} inventory items...")
-        inventory_results = self.inventory.bulk_create_inventory_items(items)
+        return asyncio.run(self.process_csv_file_async(csv_path, create_listings, workers))
+    
+    async def process_csv_file_async(self, csv_path: str, create_listings: bool = False,
+                                     workers: Optional[int] = None) -> Dict:
+        """Process CSV file, running independent API calls concurrently"""
+        # Keep only the fields listing creation needs instead of every item
+        listing_data = {}
+        csv_error = None
         
-        results = {
-            "inventory_created": len(inventory_results["successful"]),
-            "inventory_failed": len(inventory_results["failed"]),
-            "failed_items": inventory_results["failed"]
-        }
+        async def read_items():
+            nonlocal csv_error
+            items = CSVProcessor.iter_items_from_csv_async(csv_path, workers)
+            try:
+                async for item in items:
+                    if create_listings:
+                        listing_data[item.sku] = (item.category_id, item.price)
+                    yield item
+                    
+            except Exception as e:
+                # Items before the bad row are still sent; the error goes in the results
+                csv_error = str(e)
+                self.logger.error(f"Error reading CSV file {csv_path}: {e}")
+            finally:
+                await items.aclose()
         
-        if create_listings:
-            # Create and publish listings for successful inventory items
-            listings_created = 0
-            listings_failed = 0
+        async with self.async_api:
+            # Create inventory items
+            self.logger.info(f"Creating inventory items from {csv_path}...")
+            inventory_results = await self.inventory.bulk_create_inventory_items_async(read_items())
             
-            for item in items:
-                if item.sku in inventory_results["successful"]:
-                    offer_id = self.listings.create_offer(
-                        item.sku, item.category_id, item.price
-                    )
-                    
-                    if offer_id:
-                        if self.listings.publish_offer(offer_id):
-                            listings_created += 1
-                        else:
-                            listings_failed += 1
-                    else:
-                        listings_failed += 1
+            if not inventory_results["successful"] and not inventory_results["failed"]:
+                if csv_error:
+                    return {"success": False, "message": "Could not read CSV file", "csv_error": csv_error}
+                self.logger.error("No items found in CSV file")
+                return {"success": False, "message": "No items found"}
             
-            results.update({
-                "listings_created": listings_created,
-                "listings_failed": listings_failed
-            })
+            results = {
+                "inventory_created": len(inventory_results["successful"]),
+                "inventory_failed": len(inventory_results["failed"]),
+                "failed_items": inventory_results["failed"]
+            }
+            
+            if csv_error:
+                results.update({"success": False, "csv_error": csv_error})
+            
+            if create_listings:
+                # Create and publish listings for successful inventory items
+                successful = inventory_results["successful"]
+                
+                async def create_and_publish(sku: str) -> bool:
+                    # Publishing depends on the offer, but SKUs are independent
+                    offer_id = await self.listings.create_offer_async(sku, *listing_data[sku])
+                    return bool(offer_id) and await self.listings.publish_offer_async(offer_id)
+                
+                published = await self.async_api.run_batch(successful, create_and_publish, batch_size=20)
+                
+                listings_created = sum(published)
+                results.update({
+                    "listings_created": listings_created,
+                    "listings_failed": len(successful) - listings_created
+                })
         
         return results
     
@@ -606,12 +1379,17 @@ class EbayAutolister:
             }
         ]
         
+        import pandas as pd  # Imported lazily; only sample creation needs it
+        
         df = pd.DataFrame(sample_data)
         df.to_csv(file_path, index=False)
         self.logger.info(f"Sample CSV created: {file_path}")
 
 def main():
     """Example usage"""
+    # Setup logging
+    logging.basicConfig(level=logging.INFO)
+    
     # Initialize with your eBay API credentials
     client_id = os.getenv('EBAY_CLIENT_ID')
     client_secret = os.getenv('EBAY_CLIENT_SECRET')
@@ -263,6 +263,101 @@ class EbayAutolisterTester:
             self.log_test("Listing Publication", False, str(e))
             return False
     
+    def test_streaming_csv(self) -> bool:
+        """Test 9: Streaming gzipped CSV matches the local reader"""
+        try:
+            import asyncio
+            import gzip
+            import os
+            import tempfile
+            from ebay_autolister import CSVProcessor
+            
+            # An unquoted inch mark must stay literal; a quoted field may span lines
+            csv_text = (
+                'sku,title,description,category_id,price\n'
+                'INCH-001,MacBook Pro 13" Laptop,Light wear,111422,899.99\n'
+                'MULTI-002,iPad Air,"Two\nlines with ""quotes""",171485,449.99\n'
+                'LAST-003,Nintendo Switch,Works,139971,199.99\n'
+            )
+            
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                csv_path = os.path.join(tmp_dir, "streaming.csv")
+                with open(csv_path, 'w', newline='') as f:
+                    f.write(csv_text)
+                with gzip.open(csv_path + ".gz", 'wt', newline='') as f:
+                    f.write(csv_text)
+                
+                async def load_streamed():
+                    return [item async for item in CSVProcessor.iter_items_from_csv_async(csv_path + ".gz")]
+                
+                expected = CSVProcessor.load_items_from_csv(csv_path)
+                streamed = asyncio.run(load_streamed())
+            
+            if len(expected) != 3 or streamed != expected:
+                self.log_test("Streaming CSV", False,
+                            f"Streamed {len(streamed)} items, local reader loaded {len(expected)}")
+                return False
+            
+            self.log_test("Streaming CSV", True,
+                        f"Streamed {len(streamed)} items from gzipped CSV")
+            return True
+            
+        except Exception as e:
+            self.log_test("Streaming CSV", False, str(e))
+            return False
+    
+    def test_large_csv_parity(self) -> bool:
+        """Test 10: pyarrow large-file reader matches the stdlib reader"""
+        try:
+            import os
+            import tempfile
+            import ebay_autolister
+            from ebay_autolister import CSVProcessor
+            
+            try:
+                import pyarrow
+            except ImportError:
+                self.log_test("Large CSV Parity", True, "Test skipped - pyarrow not installed")
+                return True
+            
+            large_csv_bytes = ebay_autolister.LARGE_CSV_BYTES
+            arrow_block_bytes = ebay_autolister.ARROW_BLOCK_BYTES
+            
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                csv_path = os.path.join(tmp_dir, "large.csv")
+                with open(csv_path, 'w', newline='') as f:
+                    f.write('sku,title,description,category_id,price,quantity\n')
+                    for i in range(2000):
+                        if i == 1500:
+                            # Short row: the stdlib reader pads the missing quantity
+                            f.write(f'SHORT-{i},Short row,No quantity,9355,5.00\n')
+                        else:
+                            f.write(f'MULTI-{i},Item {i},"Line one\nLine ""two"" of {i}",9355,{i}.99,1\n')
+                
+                try:
+                    expected = CSVProcessor.load_items_from_csv(csv_path)
+                    
+                    # Force the pyarrow path, with quoted newlines crossing many blocks
+                    ebay_autolister.LARGE_CSV_BYTES = 0
+                    ebay_autolister.ARROW_BLOCK_BYTES = 16 * 1024
+                    loaded = CSVProcessor.load_items_from_csv(csv_path)
+                finally:
+                    ebay_autolister.LARGE_CSV_BYTES = large_csv_bytes
+                    ebay_autolister.ARROW_BLOCK_BYTES = arrow_block_bytes
+            
+            if len(expected) != 2000 or loaded != expected:
+                self.log_test("Large CSV Parity", False,
+                            f"pyarrow reader loaded {len(loaded)} items, stdlib reader loaded {len(expected)}")
+                return False
+            
+            self.log_test("Large CSV Parity", True,
+                        f"Both readers loaded {len(loaded)} identical items")
+            return True
+            
+        except Exception as e:
+            self.log_test("Large CSV Parity", False, str(e))
+            return False
+    
     def run_all_tests(self) -> Dict:
         """Run complete test suite"""
         print("🧪 Starting eBay Autolister Test Suite\n")
@@ -275,7 +370,9 @@ class EbayAutolisterTester:
             ("Inventory Creation", self.test_inventory_creation),
             ("Bulk Processing", self.test_bulk_processing),
             ("Offer Creation", self.test_offer_creation),
-            ("Listing Publication", self.test_listing_publication)
+            ("Listing Publication", self.test_listing_publication),
+            ("Streaming CSV", self.test_streaming_csv),
+            ("Large CSV Parity", self.test_large_csv_parity)
         ]
         
         passed = 0